@@ -33,14 +33,14 @@ def parse(text: str, options: TonParseOptions = None) -> TonDocument:
 
 def parse_file(filepath: str, options: TonParseOptions = None) -> TonDocument:
     """Parse a TON file into a document."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return parse(f.read(), options)
+    with open(filepath, 'rb') as f:
+        return TonParser(options).parse_bytes(f.read())
 
 
 def serialize(document: TonDocument, options: TonSerializeOptions = None) -> str:
     """Serialize a TON document to string."""
-    serializer = TonSerializer(options)
-    return serializer.serialize(document)
+    from .serializer.ton_serializer import _serialize_shared
+    return _serialize_shared(document, options)
 
 
 def serialize_to_file(document: TonDocument, filepath: str, options: TonSerializeOptions = None):
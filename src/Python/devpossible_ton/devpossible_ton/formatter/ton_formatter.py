@@ -17,11 +17,8 @@ class TonFormatter:
     
     def format(self, content: str) -> str:
         """Formats TON content"""
-        parser = TonParser()
-        document = parser.parse(content)
-        
         serializer = TonSerializer(self.options)
-        return serializer.serialize(document)
+        return serializer.reformat(content)
     
     def validate(self, original: str, formatted: str) -> bool:
         """Validates that the formatted content is equivalent to original"""
@@ -7,8 +7,12 @@ from enum import Enum, auto
 from dataclasses import dataclass
 from typing import List, Optional, Any
 import re
+import sys
 from ..errors import TonParseError
 
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class TokenType(Enum):
     """Token types for TON format."""
@@ -56,7 +60,7 @@ class TokenType(Enum):
     NEWLINE = auto()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Token:
     """Represents a lexical token."""
     type: TokenType
@@ -74,6 +78,16 @@ class TonLexer:
         re.IGNORECASE
     )
 
+    # Compiled scanners, matched at the current position so each literal is
+    # consumed by one C-level regex call instead of a per-character loop
+    GUID_SCAN_PATTERN = re.compile(
+        r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    )
+    DECIMAL_PATTERN = re.compile(r'-?[0-9]*(?:\.[0-9]+)?(?:[eE][+-]?[0-9]*)?')
+    HEX_DIGITS_PATTERN = re.compile(r'[0-9a-fA-F]*')
+    BINARY_DIGITS_PATTERN = re.compile(r'[01]*')
+    IDENTIFIER_PATTERN = re.compile(r'[A-Za-z0-9_]*')
+
     def __init__(self, text: str):
         self.text = text
         self.position = 0
@@ -225,60 +239,30 @@ class TonLexer:
 
     def _scan_number(self) -> Token:
         """Scan a number literal."""
-        value = ''
-
-        if self._peek() == '-':
-            value += self._advance()
-
         # Check for hex or binary
-        if self._peek() == '0':
-            next_char = self._peek(1)
+        offset = 1 if self._peek() == '-' else 0
+        if self._peek(offset) == '0':
+            next_char = self._peek(offset + 1)
             if next_char in ('x', 'X'):
+                self._advance_by(offset)
                 return self._scan_hex_number()
             elif next_char in ('b', 'B'):
+                self._advance_by(offset)
                 return self._scan_binary_number()
 
-        # Scan integer part
-        while self._is_digit(self._peek()):
-            value += self._advance()
-
-        # Check for decimal part
-        if self._peek() == '.' and self._is_digit(self._peek(1)):
-            value += self._advance()  # consume .
-            while self._is_digit(self._peek()):
-                value += self._advance()
-
-        # Check for scientific notation
-        exp_char = self._peek()
-        if exp_char in ('e', 'E'):
-            value += self._advance()
-            if self._peek() in ('+', '-'):
-                value += self._advance()
-            while self._is_digit(self._peek()):
-                value += self._advance()
-
+        value = self._match(self.DECIMAL_PATTERN)
         return self._create_token(TokenType.NUMBER, float(value))
 
     def _scan_hex_number(self) -> Token:
         """Scan a hexadecimal number."""
-        value = '0x'
-        self._advance()  # consume 0
-        self._advance()  # consume x
-
-        while self._is_hex_digit(self._peek()):
-            value += self._advance()
-
+        self._advance_by(2)  # consume 0x
+        value = '0x' + self._match(self.HEX_DIGITS_PATTERN)
         return self._create_token(TokenType.NUMBER, int(value, 16))
 
     def _scan_binary_number(self) -> Token:
         """Scan a binary number."""
-        value = '0b'
-        self._advance()  # consume 0
-        self._advance()  # consume b
-
-        while self._peek() in ('0', '1'):
-            value += self._advance()
-
+        self._advance_by(2)  # consume 0b
+        value = '0b' + self._match(self.BINARY_DIGITS_PATTERN)
         return self._create_token(TokenType.NUMBER, int(value[2:], 2))
 
     def _scan_enum(self) -> Token:
@@ -318,33 +302,16 @@ class TonLexer:
     def _try_to_scan_guid(self) -> Optional[str]:
         """Try to scan a GUID pattern."""
         # GUID pattern: 8-4-4-4-12 hex digits
-        start_pos = self.position
-        parts = [8, 4, 4, 4, 12]
-        guid = ''
-
-        for i, part_length in enumerate(parts):
-            if i > 0:
-                if self._peek() != '-':
-                    # Not a GUID, reset position
-                    self.position = start_pos
-                    return None
-                guid += self._advance()  # consume '-'
-
-            for j in range(part_length):
-                if not self._is_hex_digit(self._peek()):
-                    # Not a GUID, reset position
-                    self.position = start_pos
-                    return None
-                guid += self._advance()
-
+        match = self.GUID_SCAN_PATTERN.match(self.text, self.position)
+        if not match:
+            return None
+        guid = match.group()
+        self._advance_by(len(guid))
         return guid
 
     def _scan_identifier_or_keyword(self) -> Token:
         """Scan an identifier or keyword."""
-        value = ''
-
-        while self._is_alphanumeric(self._peek()) or self._peek() == '_':
-            value += self._advance()
+        value = self._match(self.IDENTIFIER_PATTERN)
 
         # Check for boolean keywords
         if value in ('true', 'false'):
@@ -438,6 +405,17 @@ class TonLexer:
         self.column += 1
         return char
 
+    def _advance_by(self, count: int) -> None:
+        """Advance over count characters on the current line."""
+        self.position += count
+        self.column += count
+
+    def _match(self, pattern: 're.Pattern') -> str:
+        """Consume and return the text matched by pattern at the current position."""
+        value = pattern.match(self.text, self.position).group()
+        self._advance_by(len(value))
+        return value
+
     def _peek(self, offset: int = 0) -> str:
         """Peek at a character without advancing."""
         pos = self.position + offset
@@ -3,12 +3,15 @@ TonArray - Array model for TON
 Copyright (c) 2024 DevPossible, LLC
 """
 
-from typing import Any, List
+from typing import Any, Iterator, List
+from .ton_value import TonValue
 
 
 class TonArray:
     """Array model for TON format."""
 
+    __slots__ = ('items',)
+
     def __init__(self):
         self.items: List[Any] = []
 
@@ -48,6 +51,11 @@ class TonArray:
     def __setitem__(self, index: int, value: Any) -> None:
         """Support subscript assignment like arr[index] = value."""
         self.set(index, value)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items, unwrapped the same way as arr[index]."""
+        for item in self.items:
+            yield item.get_value() if hasattr(item, 'get_value') else item
     
     def __eq__(self, other) -> bool:
         """Support equality comparison with lists."""
@@ -65,7 +73,10 @@ class TonArray:
         """Convert to JSON-serializable list."""
         result = []
         for item in self.items:
-            if hasattr(item, 'to_json'):
+            # Plain TonValues are the common case; skip the attribute probes for them
+            if type(item) is TonValue:
+                result.append(item._value)
+            elif hasattr(item, 'to_json'):
                 result.append(item.to_json())
             elif hasattr(item, 'get_value'):
                 result.append(item.get_value())
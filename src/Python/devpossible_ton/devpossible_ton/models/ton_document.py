@@ -4,7 +4,11 @@ Copyright (c) 2024 DevPossible, LLC
 """
 
 from typing import Union, Optional, Any
+import copy
 import json
+from .ton_value import TonValue, _KIND_OTHER
+from .ton_object import TonObject
+from .ton_array import TonArray
 
 
 class TonJSONEncoder(json.JSONEncoder):
@@ -23,6 +27,8 @@ class TonJSONEncoder(json.JSONEncoder):
 class TonDocument:
     """Root document for TON format."""
 
+    __slots__ = ('root',)
+
     def __init__(self, root: Any = None):
         self.root = root if root is not None else {}
 
@@ -39,6 +45,10 @@ class TonDocument:
         """Create a TonDocument from an object."""
         return TonDocument(obj)
 
+    def clone(self) -> 'TonDocument':
+        """Create an independent deep copy of the document."""
+        return TonDocument(_clone_node(self.root))
+
     def is_object(self) -> bool:
         """Check if root is an object."""
         from .ton_object import TonObject
@@ -84,6 +94,29 @@ class TonDocument:
         return serializer.serialize(self)
 
 
+def _clone_node(node: Any) -> Any:
+    """Deep-copy a document node, walking the model types directly instead of via deepcopy."""
+    node_type = type(node)
+    if node_type is TonValue:
+        clone = TonValue.__new__(TonValue)
+        # Scalar payloads are immutable and can be shared
+        clone._value = node._value if node._kind != _KIND_OTHER else copy.deepcopy(node._value)
+        clone._kind = node._kind
+        clone.type_hint = node.type_hint
+        return clone
+    if node_type is TonObject:
+        clone = TonObject.__new__(TonObject)
+        clone.properties = {key: _clone_node(value) for key, value in node.properties.items()}
+        clone._class_name = node._class_name
+        clone._instance_count = node._instance_count
+        return clone
+    if node_type is TonArray:
+        clone = TonArray.__new__(TonArray)
+        clone.items = list(map(_clone_node, node.items))
+        return clone
+    return copy.deepcopy(node)
+
+
 # Monkey-patch json.dumps to use our encoder by default for TonDocument types
 _original_dumps = json.dumps
 
@@ -3,12 +3,16 @@ TonObject - Object model for TON
 Copyright (c) 2024 DevPossible, LLC
 """
 
+import sys
 from typing import Any, Dict, List, Tuple, Optional
+from .ton_value import TonValue
 
 
 class TonObject:
     """Object model for TON format."""
 
+    __slots__ = ('properties', '_class_name', '_instance_count')
+
     def __init__(self, class_name: Optional[str] = None, instance_count: Optional[int] = None, instance_id: Optional[int] = None):
         self.properties: Dict[str, Any] = {}
         self._class_name: Optional[str] = None
@@ -52,6 +56,9 @@ class TonObject:
 
     def set(self, key: str, value: Any) -> None:
         """Set a property."""
+        # Interned keys are shared across objects and compare by identity on lookup
+        if type(key) is str:
+            key = sys.intern(key)
         self.properties[key] = value
 
     def get(self, key: str) -> Any:
@@ -129,7 +136,10 @@ class TonObject:
             result['_instanceId'] = self.instance_count
         
         for key, value in self.properties.items():
-            if hasattr(value, 'to_json'):
+            # Plain TonValues are the common case; skip the attribute probes for them
+            if type(value) is TonValue:
+                result[key] = value._value
+            elif hasattr(value, 'to_json'):
                 result[key] = value.to_json()
             elif hasattr(value, 'get_value'):
                 result[key] = value.get_value()
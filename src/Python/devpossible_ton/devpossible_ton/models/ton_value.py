@@ -5,14 +5,43 @@ Copyright (c) 2024 DevPossible, LLC
 
 from typing import Any, Optional
 
+# Payload kinds, computed once per value so the serializer can dispatch by index
+_KIND_NULL = 0
+_KIND_BOOL = 1
+_KIND_INT = 2
+_KIND_FLOAT = 3
+_KIND_STR = 4
+_KIND_OTHER = 5
+
+_KINDS = {
+    type(None): _KIND_NULL,
+    bool: _KIND_BOOL,
+    int: _KIND_INT,
+    float: _KIND_FLOAT,
+    str: _KIND_STR,
+}
+
 
 class TonValue:
     """Value model for TON format."""
 
+    __slots__ = ('_value', '_kind', 'type_hint')
+
     def __init__(self, value: Any, type_hint: Optional[str] = None):
         self.value = value
         self.type_hint = type_hint
 
+    @property
+    def value(self) -> Any:
+        """Get the raw value."""
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        """Set the raw value and classify its kind."""
+        self._value = value
+        self._kind = _KINDS.get(type(value), _KIND_OTHER)
+
     def get_value(self) -> Any:
         """Get the value."""
         # Convert date strings to datetime objects if type hint is 'date'
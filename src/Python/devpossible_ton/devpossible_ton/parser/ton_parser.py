@@ -3,12 +3,21 @@ TonParser - Parser for TON format
 Copyright (c) 2024 DevPossible, LLC
 """
 
+import threading
 from dataclasses import dataclass
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple, Union
 from ..lexer import TonLexer, Token, TokenType
 from ..models import TonDocument, TonObject, TonValue, TonArray
 from ..errors import TonParseError
 
+# Number of parsed documents kept by TonParser.parse, keyed by text and options
+_PARSE_CACHE_SIZE = 256
+# Longer texts are rarely parsed twice, and copying their documents costs more than it saves
+_PARSE_CACHE_MAX_TEXT = 16 * 1024
+_parse_cache: Dict[Tuple[str, bool], TonDocument] = {}
+# Held while the cache changes size, so eviction never sees it change mid-iteration
+_parse_cache_lock = threading.Lock()
+
 
 @dataclass
 class TonParseOptions:
@@ -16,6 +25,8 @@ class TonParseOptions:
     allow_trailing_comma: bool = False
     strict_mode: bool = True
     allow_partial: bool = False
+    # Reuse documents for recently parsed texts; see TonParser.parse
+    use_cache: bool = True
 
 
 class TonParser:
@@ -30,7 +41,38 @@ class TonParser:
         self.current = 0
 
     def parse(self, text: str) -> TonDocument:
-        """Parse TON text into a document."""
+        """Parse TON text into a document.
+
+        Documents for recently parsed short texts are cached; each call returns
+        its own copy, so callers may modify the result freely. Set use_cache in
+        the options to False to always parse the text.
+        """
+        if not self.options.use_cache or len(text) > _PARSE_CACHE_MAX_TEXT:
+            return self._parse_tokens(text)
+
+        # allow_trailing_comma is the only option that changes the parsed result
+        key = (text, self.options.allow_trailing_comma)
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            return cached.clone()
+
+        document = self._parse_tokens(text)
+        cached = document.clone()
+        with _parse_cache_lock:
+            if len(_parse_cache) >= _PARSE_CACHE_SIZE:
+                # Evict the oldest entry
+                del _parse_cache[next(iter(_parse_cache))]
+            _parse_cache[key] = cached
+        return document
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all documents cached by parse."""
+        with _parse_cache_lock:
+            _parse_cache.clear()
+
+    def _parse_tokens(self, text: str) -> TonDocument:
+        """Tokenize and parse TON text into a new document."""
         lexer = TonLexer(text)
         self.tokens = lexer.tokenize()
         self.current = 0
@@ -56,10 +98,22 @@ class TonParser:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
         
-        return self.parse(content)
+        return self.parse_bytes(content)
+
+    def parse_bytes(self, data: Union[bytes, bytearray, memoryview],
+                    encoding: str = 'utf-8') -> TonDocument:
+        """Parse encoded TON text into a document.
+
+        The data is decoded in a single call and line endings are normalized to
+        '\\n', as reading the file in text mode would do.
+        """
+        text = str(data, encoding)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return self.parse(text)
     
     async def parse_file_async(self, file_path: str) -> TonDocument:
         """Parse a TON file into a document asynchronously."""
@@ -3,132 +3,357 @@ TonSerializer - Serializer for TON format
 Copyright (c) 2024 DevPossible, LLC
 """
 
-from typing import Optional, Any
+import re
+import sys
+import threading
+from array import array
+from operator import attrgetter, itemgetter
+from typing import Optional, Any, Dict, List, Sequence, Tuple
+from ..errors import TonParseError
+from ..lexer import TonLexer, Token, TokenType
 from ..models import TonDocument, TonObject, TonValue, TonArray, TonEnum
+from ..models.ton_value import _KINDS, _KIND_OTHER
+from ..parser import TonParseOptions
 from .ton_serialize_options import TonSerializeOptions, TonFormatStyle
 
+# GUIDs are written unquoted
+_GUID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+# Characters that need escaping inside a double- or single-quoted string
+_ESCAPE_DOUBLE = re.compile(r'[\\"\n\r\t]')
+_ESCAPE_SINGLE = re.compile(r"[\\'\n\r\t]")
+_ESCAPES = {
+    '\\': '\\\\',
+    '"': '\\"',
+    "'": "\\'",
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+}
+
+
+# Prefix written before a value carrying a type hint
+_HINT_PREFIXES = {
+    'string': '$',
+    'number': '%',
+    'boolean': '&',
+    'date': '^'
+}
+
+# Hints serialized in |pipe| syntax rather than as a prefixed value
+_ENUM_HINTS = frozenset(('enum', 'enumSet'))
+
+# Most property prefixes a serializer caches before the cache is cleared
+_KEY_PREFIX_CACHE_SIZE = 4096
+
+# Text of the small ints that make up most counts, ports and versions
+_SMALL_INT_MIN, _SMALL_INT_MAX = -256, 1024
+_INT_STR = {i: str(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1)}
+
+# Sort key for (key, value) property pairs
+_item_key = itemgetter(0)
+
+# Checks for arrays whose items can all be written in one pass
+_TON_VALUE_TYPE = frozenset((TonValue,))
+_PLAIN_NUMBER_TYPES = frozenset((int, float))
+_type_hint_of = attrgetter('type_hint')
+
+# Tokens that are written as plain values, and the hints set by hint prefixes
+_SCALAR_TOKENS = frozenset((TokenType.STRING, TokenType.NUMBER, TokenType.BOOLEAN,
+                            TokenType.NULL, TokenType.UNDEFINED, TokenType.GUID))
+_ENUM_TOKENS = frozenset((TokenType.ENUM, TokenType.ENUM_SET))
+_HINT_TOKENS = {
+    TokenType.STRING_HINT: 'string',
+    TokenType.NUMBER_HINT: 'number',
+    TokenType.BOOLEAN_HINT: 'boolean',
+    TokenType.DATE_HINT: 'date',
+}
+
+
+def _escape_char(match: 're.Match') -> str:
+    """Get the escape sequence for a matched character."""
+    return _ESCAPES[match.group()]
+
 
 class TonSerializer:
     """Serializer for TON format."""
 
+    __slots__ = ('options', '_key_prefixes', '_serialize_object', '_serialize_array',
+                 '_property_separator', '_line_ending', '_indent', '_array_separator',
+                 '_sort_properties', '_include_type_hints', '_omit_nulls',
+                 '_omit_empty_collections', '_quote', '_escape_pattern', '_format_style',
+                 '_newline_indents')
+
     def __init__(self, options: Optional[TonSerializeOptions] = None):
         self.options = options or TonSerializeOptions()
+        # Cache of 'key + property_separator' per property name seen so far
+        self._key_prefixes: Dict[str, str] = {}
+        self._property_separator: Optional[str] = None
+        self._format_style: Optional[TonFormatStyle] = None
+        self._line_ending: Optional[str] = None
+        self._indent: Optional[str] = None
+        # Line ending plus indentation, by depth; grown as deeper levels are reached
+        self._newline_indents: List[str] = []
 
     def serialize(self, document: TonDocument) -> str:
         """Serialize a document to TON format."""
-        result = []
-        
-        # Add header if requested
+        self._load_options()
+
+        # Fragments are appended to one list and joined once at the end
+        parts: List[str] = []
+        self._write_header(parts)
+
+        # Serialize the root value
+        self._serialize_value(document.get_root(), parts, 0)
+
+        return ''.join(parts)
+
+    def reformat(self, source: str, parse_options: Optional[TonParseOptions] = None) -> str:
+        """Reformat TON text without building a document.
+
+        Gives the same result as serializing TonParser(parse_options).parse(source),
+        but values are written straight from the token stream, so no TonObject,
+        TonArray or TonValue is created per node.
+        """
+        self._load_options()
+        allow_trailing_comma = (parse_options or TonParseOptions()).allow_trailing_comma
+        writer = _TokenWriter(self, TonLexer(source).tokenize(), allow_trailing_comma)
+
+        parts: List[str] = []
+        self._write_header(parts)
+        writer.write_document(parts)
+
+        return ''.join(parts)
+
+    def _write_header(self, parts: List[str]) -> None:
+        """Append the header lines if requested."""
         if self.options.include_header:
-            result.append(f"#TON {self.options.ton_version}")
+            line_ending = self._line_ending
+            parts.append(f"#TON {self.options.ton_version}{line_ending}")
             if self.options.schema_file:
-                result.append(f"#SCHEMA {self.options.schema_file}")
-            result.append("")
-        
-        # Serialize the root value
-        result.append(self._serialize_value(document.get_root(), 0))
-        
-        return self.options.line_ending.join(result)
+                parts.append(f"#SCHEMA {self.options.schema_file}{line_ending}")
+            parts.append(line_ending)
+
+    def _load_options(self) -> None:
+        """Copy the options read during recursion into slots for fast access."""
+        options = self.options
+        if (options.property_separator != self._property_separator
+                or len(self._key_prefixes) > _KEY_PREFIX_CACHE_SIZE):
+            # Start over when the separator changes, or once a long-lived serializer
+            # has seen too many distinct keys
+            self._property_separator = options.property_separator
+            self._key_prefixes.clear()
+        if options.format_style != self._format_style:
+            # Bind the style-specific writers so recursion never re-checks the style
+            self._format_style = options.format_style
+            if options.format_style == TonFormatStyle.COMPACT:
+                self._serialize_object = self._serialize_object_compact
+                self._serialize_array = self._serialize_array_compact
+            else:
+                self._serialize_object = self._serialize_object_pretty
+                self._serialize_array = self._serialize_array_pretty
+        indent = options.indentation or ''
+        if options.line_ending != self._line_ending or indent != self._indent:
+            self._line_ending = options.line_ending
+            self._indent = indent
+            self._newline_indents = [options.line_ending]
+        self._array_separator = options.array_separator
+        self._sort_properties = options.sort_properties
+        self._include_type_hints = options.include_type_hints
+        self._omit_nulls = options.omit_nulls
+        self._omit_empty_collections = options.omit_empty_collections
+        if options.quote_style == 'double':
+            self._quote, self._escape_pattern = '"', _ESCAPE_DOUBLE
+        else:
+            self._quote, self._escape_pattern = "'", _ESCAPE_SINGLE
 
-    def _serialize_value(self, value: Any, indent_level: int) -> str:
+    def _serialize_value(self, value: Any, parts: List[str], indent_level: int) -> None:
         """Serialize a value."""
         if isinstance(value, TonObject):
-            return self._serialize_object(value, indent_level)
+            self._serialize_object(value, parts, indent_level)
         elif isinstance(value, dict):
-            # Handle plain Python dicts by wrapping in TonObject
+            # Handle plain Python dicts by wrapping in TonObject; the dict is only
+            # read, so the wrapper can use it as its properties without a copy
             obj = TonObject()
-            for k, v in value.items():
-                obj.set(k, v)
-            return self._serialize_object(obj, indent_level)
+            obj.properties = value
+            self._serialize_object(obj, parts, indent_level)
         elif isinstance(value, TonArray):
-            return self._serialize_array(value, indent_level)
+            self._serialize_array(value, parts, indent_level)
         elif isinstance(value, list):
             # Handle plain Python lists by wrapping in TonArray
             arr = TonArray()
-            for item in value:
-                arr.add(item)
-            return self._serialize_array(arr, indent_level)
+            arr.items.extend(value)
+            self._serialize_array(arr, parts, indent_level)
+        elif isinstance(value, array):
+            # Typed arrays are only read, so the wrapper uses them as its items
+            # without boxing every element into a list
+            arr = TonArray()
+            arr.items = value
+            self._serialize_array(arr, parts, indent_level)
         elif isinstance(value, TonValue):
-            # Handle enum and enumSet type hints
-            if hasattr(value, 'type_hint') and value.type_hint:
-                if value.type_hint == 'enum':
-                    return f'|{value.get_value()}|'
-                elif value.type_hint == 'enumSet':
-                    val = value.get_value()
-                    if isinstance(val, list):
-                        return '|' + '|'.join(str(v) for v in val) + '|'
-                    return f'|{val}|'
-                else:
-                    return self._serialize_primitive(value.get_value(), value.type_hint)
-            return self._serialize_primitive(value.get_value())
+            type_hint = value.type_hint
+            if not type_hint:
+                # Dispatch on the kind TonValue computed when the value was set
+                parts.append(self._WRITERS[value._kind](self, value._value))
+            else:
+                parts.append(self._serialize_hinted(value, type_hint))
         elif isinstance(value, TonEnum):
-            return str(value)
+            parts.append(str(value))
         else:
-            return self._serialize_primitive(value)
+            parts.append(self._serialize_primitive(value))
 
-    def _serialize_object(self, obj: TonObject, indent_level: int) -> str:
-        """Serialize an object."""
-        is_compact = self.options.format_style == TonFormatStyle.COMPACT
-        
-        # Add class name prefix if present
-        prefix = ''
-        if obj.class_name:
-            prefix = obj.class_name
-            if obj.instance_count is not None:
-                prefix += f'({obj.instance_count})'
-        
-        # Check if object is empty (or all values are omitted)
+    def _serialize_hinted(self, value: TonValue, type_hint: str) -> str:
+        """Serialize a TonValue that has a type hint."""
+        if type_hint not in _ENUM_HINTS:
+            return self._serialize_primitive(value.get_value(), type_hint)
+        elif type_hint == 'enum':
+            return f'|{value.get_value()}|'
+
+        val = value.get_value()
+        if isinstance(val, list):
+            try:
+                # Enum set values are almost always strings already
+                joined = '|'.join(val)
+            except TypeError:
+                joined = '|'.join(map(str, val))
+            return f'|{joined}|'
+        return f'|{val}|'
+
+    def _object_prefix(self, obj: TonObject) -> str:
+        """Get the class name prefix of an object."""
+        if not obj.class_name:
+            return ''
+        prefix = obj.class_name
+        if obj.instance_count is not None:
+            prefix += f'({obj.instance_count})'
+        return prefix
+
+    def _object_items(self, obj: TonObject) -> list:
+        """Get the (key prefix, value) pairs of an object that should be emitted."""
+        key_prefixes = self._key_prefixes
         non_omitted_items = []
-        keys = sorted(obj.keys()) if self.options.sort_properties else obj.keys()
-        for key in keys:
+        # Iterate the property dict directly rather than looking each key up again
+        items = obj.properties.items()
+        if self._sort_properties:
+            items = sorted(items, key=_item_key)
+        # Nothing can be omitted unless one of the omit options is set
+        check_omit = self._omit_nulls or self._omit_empty_collections
+        for key, value in items:
             # Skip metadata properties (_className, _instanceCount)
             if key.startswith('_'):
                 continue
-            value = obj.get(key)
-            if not self._should_omit_value(value):
-                non_omitted_items.append((key, value))
-        
+            if check_omit and self._should_omit_value(value):
+                continue
+            key_prefix = key_prefixes.get(key)
+            if key_prefix is None:
+                key_prefix = key_prefixes[key] = sys.intern(key) + self._property_separator
+            non_omitted_items.append((key_prefix, value))
+        return non_omitted_items
+
+    def _serialize_object_compact(self, obj: TonObject, parts: List[str],
+                                  indent_level: int) -> None:
+        """Serialize an object in compact style."""
+        parts.append(self._object_prefix(obj))
+        non_omitted_items = self._object_items(obj)
+
         # If empty, return compact format regardless of style
         if len(non_omitted_items) == 0:
-            return prefix + '{}'
-        
-        if is_compact:
-            items = []
-            for key, value in non_omitted_items:
-                val_str = self._serialize_value(value, 0)
-                items.append(f'{key}{self.options.property_separator}{val_str}')
-            content = '{' + ','.join(items) + '}'
-            return prefix + content
-        else:
-            lines = ['{']
-            indent = self.options.indentation or ''
-            current_indent = indent * (indent_level + 1)
-            
-            for key, value in non_omitted_items:
-                val_str = self._serialize_value(value, indent_level + 1)
-                lines.append(f'{current_indent}{key}{self.options.property_separator}{val_str}')
-            
-            lines.append((indent * indent_level) + '}')
-            content = self.options.line_ending.join(lines)
-            return prefix + content
-
-    def _serialize_array(self, arr: TonArray, indent_level: int) -> str:
-        """Serialize an array."""
-        if self.options.omit_empty_collections and arr.length() == 0:
-            return '[]'
-        
-        is_compact = self.options.format_style == TonFormatStyle.COMPACT
-        items = [self._serialize_value(item, indent_level) for item in arr.to_array()]
-        
-        if is_compact:
-            return '[' + self.options.array_separator.join(items) + ']'
+            parts.append('{}')
+            return
+
+        parts.append('{')
+        for i, (key_prefix, value) in enumerate(non_omitted_items):
+            parts.append(',' + key_prefix if i else key_prefix)
+            self._serialize_value(value, parts, 0)
+        parts.append('}')
+
+    def _serialize_object_pretty(self, obj: TonObject, parts: List[str],
+                                 indent_level: int) -> None:
+        """Serialize an object in pretty style."""
+        parts.append(self._object_prefix(obj))
+        non_omitted_items = self._object_items(obj)
+
+        # If empty, return compact format regardless of style
+        if len(non_omitted_items) == 0:
+            parts.append('{}')
+            return
+
+        current_indent = self._newline_indent(indent_level + 1)
+
+        parts.append('{')
+        for key_prefix, value in non_omitted_items:
+            parts.append(current_indent + key_prefix)
+            self._serialize_value(value, parts, indent_level + 1)
+        parts.append(self._newline_indent(indent_level) + '}')
+
+    def _serialize_array_compact(self, arr: TonArray, parts: List[str], indent_level: int) -> None:
+        """Serialize an array in compact style."""
+        if self._omit_empty_collections and arr.length() == 0:
+            parts.append('[]')
+            return
+
+        separator = self._array_separator
+        texts = self._primitive_texts(arr.items)
+        if texts is not None:
+            parts.append('[' + separator.join(texts) + ']')
+            return
+
+        parts.append('[')
+        for i, item in enumerate(arr.items):
+            if i:
+                parts.append(separator)
+            self._serialize_value(item, parts, indent_level)
+        parts.append(']')
+
+    def _serialize_array_pretty(self, arr: TonArray, parts: List[str], indent_level: int) -> None:
+        """Serialize an array in pretty style."""
+        if self._omit_empty_collections and arr.length() == 0:
+            parts.append('[]')
+            return
+
+        current_indent = self._newline_indent(indent_level + 1)
+
+        # Pretty arrays don't have commas between lines (based on test expectations)
+        parts.append('[')
+        texts = self._primitive_texts(arr.items)
+        if texts is not None:
+            parts.append(current_indent + current_indent.join(texts))
         else:
-            indent = self.options.indentation or ''
-            current_indent = indent * (indent_level + 1)
-            # Pretty arrays don't have commas between lines (based on test expectations)
-            return '[' + self.options.line_ending + \
-                   self.options.line_ending.join(f'{current_indent}{item}' for item in items) + \
-                   self.options.line_ending + (indent * indent_level) + ']'
+            for item in arr.items:
+                parts.append(current_indent)
+                self._serialize_value(item, parts, indent_level)
+        if not arr.items:
+            # An empty array still spans a blank line
+            parts.append(self._line_ending)
+        parts.append(self._newline_indent(indent_level) + ']')
+
+    def _primitive_texts(self, items: Sequence[Any]) -> Optional[List[str]]:
+        """Serialize array items in one pass if all are un-hinted TonValues or plain numbers.
+
+        items is a list, or a typed array when the value being serialized was one.
+        Returns None if any item needs the general, per-item path.
+        """
+        if not items:
+            return None
+        if type(items) is array:
+            # The typecode fixes the element type, so no per-item type check is needed
+            return list(map(str, items)) if items.typecode != 'u' else None
+        item_types = set(map(type, items))
+        if item_types <= _PLAIN_NUMBER_TYPES:
+            # Raw ints and floats, e.g. from a Python list; str() is what they'd get anyway
+            return list(map(str, items))
+        if not item_types <= _TON_VALUE_TYPE or any(map(_type_hint_of, items)):
+            return None
+        writers = self._WRITERS
+        return [writers[item._kind](self, item._value) for item in items]
+
+    def _newline_indent(self, depth: int) -> str:
+        """Get the line ending followed by the indentation for a depth."""
+        newline_indents = self._newline_indents
+        while len(newline_indents) <= depth:
+            newline_indents.append(newline_indents[-1] + self._indent)
+        return newline_indents[depth]
 
     def _serialize_primitive(self, value: Any, type_hint: Optional[str] = None) -> str:
         """Serialize a primitive value."""
@@ -136,13 +361,13 @@ class TonSerializer:
             return 'null'
         elif value is True:
             # Handle type hints for booleans
-            if self.options.include_type_hints and type_hint:
+            if self._include_type_hints and type_hint:
                 prefix = self._get_type_hint_prefix(type_hint)
                 return f'{prefix}true'
             return 'true'
         elif value is False:
             # Handle type hints for booleans
-            if self.options.include_type_hints and type_hint:
+            if self._include_type_hints and type_hint:
                 prefix = self._get_type_hint_prefix(type_hint)
                 return f'{prefix}false'
             return 'false'
@@ -152,15 +377,11 @@ class TonSerializer:
                 return value
             
             # Handle type hints with prefixes
-            if self.options.include_type_hints and type_hint:
+            if self._include_type_hints and type_hint:
                 prefix = self._get_type_hint_prefix(type_hint)
-                quote = '"' if self.options.quote_style == 'double' else "'"
-                return f'{prefix}{quote}{value}{quote}'
-            
-            quote = '"' if self.options.quote_style == 'double' else "'"
-            # Escape quotes in the string
-            escaped = value.replace('\\', '\\\\').replace(quote, f'\\{quote}')
-            return f'{quote}{escaped}{quote}'
+                return prefix + self._escape_string(value)
+
+            return self._escape_string(value)
         elif hasattr(value, 'isoformat'):
             # Handle datetime objects
             iso_string = value.isoformat()
@@ -168,51 +389,335 @@ class TonSerializer:
                 # Convert to date-only format if it's midnight
                 iso_string = iso_string.split('T')[0] if value.hour == 0 and value.minute == 0 and value.second == 0 else iso_string
             
-            if self.options.include_type_hints and type_hint:
+            if self._include_type_hints and type_hint:
                 prefix = self._get_type_hint_prefix(type_hint)
-                quote = '"' if self.options.quote_style == 'double' else "'"
+                quote = self._quote
                 return f'{prefix}{quote}{iso_string}{quote}'
             
-            quote = '"' if self.options.quote_style == 'double' else "'"
+            quote = self._quote
             return f'{quote}{iso_string}{quote}'
         else:
             # Handle type hints for numbers
-            if self.options.include_type_hints and type_hint:
+            if self._include_type_hints and type_hint:
                 prefix = self._get_type_hint_prefix(type_hint)
                 return f'{prefix}{value}'
             return str(value)
     
+    def _write_null(self, value: None) -> str:
+        """Serialize null."""
+        return 'null'
+
+    def _write_bool(self, value: bool) -> str:
+        """Serialize a boolean."""
+        return 'true' if value else 'false'
+
+    def _write_int(self, value: int) -> str:
+        """Serialize an int, reusing the cached text of small ints."""
+        text = _INT_STR.get(value)
+        if text is None:
+            text = str(value)
+        return text
+
+    def _write_float(self, value: float) -> str:
+        """Serialize a float."""
+        return repr(value)
+
+    def _write_string(self, value: str) -> str:
+        """Serialize a string, leaving GUIDs unquoted."""
+        if self._is_guid(value):
+            return value
+        return self._escape_string(value)
+
+    # Writers for un-hinted TonValues, indexed by TonValue._kind
+    # (null, bool, int, float, str, other)
+    _WRITERS = (
+        _write_null,
+        _write_bool,
+        _write_int,
+        _write_float,
+        _write_string,
+        _serialize_primitive,
+    )
+
+    def _escape_string(self, value: str) -> str:
+        """Quote a string, escaping quotes, backslashes and line breaks."""
+        quote = self._quote
+        pattern = self._escape_pattern
+
+        # Most strings need no escaping; one regex scan finds out
+        if pattern.search(value) is None:
+            return quote + value + quote
+        return quote + pattern.sub(_escape_char, value) + quote
+
     def _is_guid(self, value: str) -> bool:
         """Check if a string is a GUID."""
-        import re
-        guid_pattern = r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
-        return bool(re.match(guid_pattern, value))
+        # Length and dash positions rule out almost every string before the regex runs
+        if len(value) != 36 or value[8] != '-' or value[23] != '-':
+            return False
+        return _GUID_PATTERN.fullmatch(value) is not None
     
     def _get_type_hint_prefix(self, type_hint: str) -> str:
         """Get the prefix for a type hint."""
-        prefixes = {
-            'string': '$',
-            'number': '%',
-            'boolean': '&',
-            'date': '^'
-        }
-        return prefixes.get(type_hint.lower(), '')
+        prefix = _HINT_PREFIXES.get(type_hint)
+        if prefix is None:
+            prefix = _HINT_PREFIXES.get(type_hint.lower(), '')
+        return prefix
     
     def _should_omit_value(self, value: Any) -> bool:
         """Check if a value should be omitted based on options."""
-        # Check for TonValue wrapping
-        actual_value = value.get_value() if hasattr(value, 'get_value') else value
+        # Check for TonValue wrapping; a plain TonValue is only None if its raw value is
+        if type(value) is TonValue:
+            actual_value = value._value
+        elif hasattr(value, 'get_value'):
+            actual_value = value.get_value()
+        else:
+            actual_value = value
         
         if actual_value is None:
             # Only omit if explicitly requested
-            if self.options.omit_nulls:
+            if self._omit_nulls:
                 return True
             # Don't auto-omit nulls even if omit_undefined is true
             # (in TON, null and undefined are different)
             return False
         
-        if isinstance(value, (TonArray, list)) and len(value) == 0 and self.options.omit_empty_collections:
-            return True
-        if isinstance(value, (TonObject, dict)) and len(value) == 0 and self.options.omit_empty_collections:
+        if (self._omit_empty_collections
+                and isinstance(value, (TonArray, list, array, TonObject, dict))
+                and len(value) == 0):
             return True
         return False
+
+
+# Serializers reused by _serialize_shared(), one per thread
+_thread_serializers = threading.local()
+
+
+def _serialize_shared(document: TonDocument, options: Optional[TonSerializeOptions] = None) -> str:
+    """Serialize a document with this thread's shared serializer.
+
+    Repeated calls reuse one serializer and its cache of key prefixes instead of
+    building a new one each time. A nested call made while the shared serializer
+    is busy (e.g. from a value's isoformat()) uses a fresh serializer, so the
+    outer call's options are left alone.
+    """
+    state = _thread_serializers
+    serializer = getattr(state, 'serializer', None)
+    if serializer is None:
+        serializer = state.serializer = TonSerializer()
+        state.default_options = serializer.options
+        state.busy = False
+    elif state.busy:
+        return TonSerializer(options).serialize(document)
+
+    serializer.options = options or state.default_options
+    state.busy = True
+    try:
+        return serializer.serialize(document)
+    finally:
+        state.busy = False
+
+
+class _TokenWriter:
+    """Writes a token stream with a serializer's options, following TonParser's grammar.
+
+    Each value is written where TonParser would create a model for it; objects
+    buffer their properties so duplicate keys, omitted values and sorting behave
+    as they do when serializing a parsed document.
+    """
+
+    __slots__ = ('serializer', 'tokens', 'current', 'allow_trailing_comma')
+
+    def __init__(self, serializer: TonSerializer, tokens: List[Token], allow_trailing_comma: bool):
+        self.serializer = serializer
+        self.tokens = tokens
+        self.current = 0
+        self.allow_trailing_comma = allow_trailing_comma
+
+    def write_document(self, parts: List[str]) -> None:
+        """Write the root value, which must be followed by the end of input."""
+        self._write_value(parts, 0)
+
+        token = self.tokens[self.current]
+        if token.type != TokenType.END_OF_FILE:
+            raise TonParseError('Unexpected content after parsing', token.line, token.column)
+
+    def _write_value(self, parts: List[str], indent_level: int,
+                     type_hint: Optional[str] = None) -> bool:
+        """Write a value, returning True if the serializer would omit it from an object."""
+        token = self.tokens[self.current]
+        token_type = token.type
+
+        if token_type == TokenType.LEFT_BRACE:
+            return self._write_object(parts, indent_level)
+        elif token_type == TokenType.LEFT_BRACKET:
+            return self._write_array(parts, indent_level)
+        elif token_type in _SCALAR_TOKENS:
+            self._advance()
+            return self._write_scalar(parts, token.value, type_hint)
+        elif token_type in _ENUM_TOKENS:
+            self._advance()
+            return self._write_scalar(parts, token.value, type_hint or 'enum')
+        elif token_type in _HINT_TOKENS:
+            # The outermost hint wins, as the parser sets hints after parsing the value
+            self._advance()
+            return self._write_value(parts, indent_level, type_hint or _HINT_TOKENS[token_type])
+        elif token_type == TokenType.CLASS_NAME:
+            return self._write_typed_object(parts, indent_level)
+        elif token_type == TokenType.END_OF_FILE:
+            raise TonParseError('Unexpected end of input', token.line, token.column)
+        else:
+            raise TonParseError(f'Unexpected token: {token_type}', token.line, token.column)
+
+    def _write_scalar(self, parts: List[str], value: Any, type_hint: Optional[str]) -> bool:
+        """Write a primitive value."""
+        serializer = self.serializer
+        if type_hint:
+            # Hinted values are rare; TonValue keeps the date handling in one place
+            parts.append(serializer._serialize_hinted(TonValue(value, type_hint), type_hint))
+        else:
+            writer = serializer._WRITERS[_KINDS.get(type(value), _KIND_OTHER)]
+            parts.append(writer(serializer, value))
+        return value is None and serializer._omit_nulls
+
+    def _write_typed_object(self, parts: List[str], indent_level: int) -> bool:
+        """Write an object with a class name and optional instance count."""
+        class_name = self._advance().value
+
+        instance_count = None
+        if self._check(TokenType.LEFT_PAREN):
+            self._advance()  # consume (
+            count_token = self._consume(TokenType.NUMBER, 'Expected instance count')
+            instance_count = int(count_token.value)
+            self._consume(TokenType.RIGHT_PAREN, 'Expected )')
+
+        prefix = class_name
+        if instance_count is not None:
+            prefix += f'({instance_count})'
+        self._write_object(parts, indent_level, prefix)
+
+        # The class name is stored as a property, so a typed object is never empty
+        return False
+
+    def _write_object(self, parts: List[str], indent_level: int, prefix: str = '') -> bool:
+        """Write an object."""
+        serializer = self.serializer
+        self._consume(TokenType.LEFT_BRACE, 'Expected {')
+
+        # Rendered value fragments by key, or None for omitted values
+        items: Dict[str, Optional[List[str]]] = {}
+
+        while not self._check(TokenType.RIGHT_BRACE) and not self._is_at_end():
+            name_token = self._advance()
+            if name_token.type not in (TokenType.IDENTIFIER, TokenType.STRING):
+                raise TonParseError('Expected property name', name_token.line, name_token.column)
+
+            # Check for type annotation (name:type: value syntax)
+            type_hint = None
+            if self._check(TokenType.COLON):
+                self._advance()
+                if self._check(TokenType.IDENTIFIER):
+                    type_hint = self._advance().value
+                    if self._check(TokenType.COLON):
+                        self._advance()
+
+            value_parts: List[str] = []
+            omitted = self._write_value(value_parts, indent_level + 1, type_hint)
+            items[name_token.value] = None if omitted else value_parts
+
+            if not self._check(TokenType.RIGHT_BRACE) and self._check(TokenType.COMMA):
+                self._advance()
+
+        self._consume(TokenType.RIGHT_BRACE, 'Expected }')
+
+        # Emit the same way as the style-specific object writers
+        item_list: List[Tuple[str, List[str]]] = [
+            (key, value_parts) for key, value_parts in items.items()
+            if value_parts is not None and not key.startswith('_')
+        ]
+        if serializer._sort_properties:
+            item_list.sort(key=_item_key)
+
+        parts.append(prefix)
+        if not item_list:
+            parts.append('{}')
+            return not items and serializer._omit_empty_collections
+
+        separator = serializer._property_separator
+        if serializer.options.format_style == TonFormatStyle.COMPACT:
+            parts.append('{')
+            for i, (key, value_parts) in enumerate(item_list):
+                parts.append((',' if i else '') + key + separator)
+                parts.extend(value_parts)
+            parts.append('}')
+        else:
+            current_indent = serializer._newline_indent(indent_level + 1)
+            parts.append('{')
+            for key, value_parts in item_list:
+                parts.append(current_indent + key + separator)
+                parts.extend(value_parts)
+            parts.append(serializer._newline_indent(indent_level) + '}')
+        return False
+
+    def _write_array(self, parts: List[str], indent_level: int) -> bool:
+        """Write an array."""
+        serializer = self.serializer
+        self._consume(TokenType.LEFT_BRACKET, 'Expected [')
+
+        if self._check(TokenType.RIGHT_BRACKET) and serializer._omit_empty_collections:
+            self._advance()
+            parts.append('[]')
+            return True
+
+        compact = serializer.options.format_style == TonFormatStyle.COMPACT
+        if compact:
+            separator = serializer._array_separator
+        else:
+            separator = serializer._newline_indent(indent_level + 1)
+        parts.append('[')
+
+        count = 0
+        while not self._check(TokenType.RIGHT_BRACKET) and not self._is_at_end():
+            if count or not compact:
+                parts.append(separator)
+            self._write_value(parts, indent_level)
+            count += 1
+
+            if not self._check(TokenType.RIGHT_BRACKET):
+                if self._check(TokenType.COMMA):
+                    self._advance()
+                elif not self.allow_trailing_comma:
+                    next_token = self.tokens[self.current]
+                    raise TonParseError('Expected comma or ]', next_token.line, next_token.column)
+
+        self._consume(TokenType.RIGHT_BRACKET, 'Expected ]')
+        if compact:
+            parts.append(']')
+        else:
+            if not count:
+                # An empty array still spans a blank line
+                parts.append(serializer._line_ending)
+            parts.append(serializer._newline_indent(indent_level) + ']')
+        return count == 0 and serializer._omit_empty_collections
+
+    def _consume(self, token_type: TokenType, message: str) -> Token:
+        """Consume a token of the expected type."""
+        if self._check(token_type):
+            return self._advance()
+
+        token = self.tokens[self.current]
+        raise TonParseError(message, token.line, token.column)
+
+    def _check(self, token_type: TokenType) -> bool:
+        """Check if current token is of expected type."""
+        return self.tokens[self.current].type == token_type
+
+    def _advance(self) -> Token:
+        """Advance to next token."""
+        token = self.tokens[self.current]
+        if token.type != TokenType.END_OF_FILE:
+            self.current += 1
+        return token
+
+    def _is_at_end(self) -> bool:
+        """Check if at end of tokens."""
+        return self.tokens[self.current].type == TokenType.END_OF_FILE
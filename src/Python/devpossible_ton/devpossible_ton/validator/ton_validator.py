@@ -3,170 +3,433 @@ TonValidator - Validator for TON format
 Copyright (c) 2024 DevPossible, LLC
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+import sys
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 from ..models import TonDocument, TonObject, TonValue, TonArray
 from ..errors import TonValidationError
 
+# Shorter arrays are checked item by item; below this the bulk pass costs more than it saves
+_BULK_CHECK_MIN_ITEMS = 8
+
+# Exact types accepted by the bulk number check (bool is an int subclass, as in _validate_number)
+_NUMBER_TYPES = frozenset((int, float, bool))
+_STRING_TYPES = frozenset((str,))
+
+# Error codes, indexing into _MESSAGES
+_E_TYPE = 0
+_E_REQUIRED = 1
+_E_MIN_ITEMS = 2
+_E_MAX_ITEMS = 3
+_E_ENUM = 4
+_E_MIN_LENGTH = 5
+_E_MAX_LENGTH = 6
+_E_MINIMUM = 7
+_E_MAXIMUM = 8
+
+_MESSAGES = (
+    "{path}: Expected {a}, got {b.__name__}",
+    "{path}: Missing required property '{a}'",
+    "{path}: Array has {a} items, minimum is {b}",
+    "{path}: Array has {a} items, maximum is {b}",
+    '{path}: Value "{a}" is not in enum {b}',
+    "{path}: String length {a} is less than minimum {b}",
+    "{path}: String length {a} exceeds maximum {b}",
+    "{path}: Value {a} is less than minimum {b}",
+    "{path}: Value {a} exceeds maximum {b}",
+)
+
+
+# Path of a value as segments: property names (str) and array indices (int)
+_Path = Tuple[Union[str, int], ...]
+
+
+def _format_path(path: _Path) -> str:
+    """Join path segments into 'a.b[0].c' form."""
+    parts = []
+    for segment in path:
+        if isinstance(segment, int):
+            parts.append(f'[{segment}]')
+        elif parts:
+            parts.append('.' + segment)
+        else:
+            parts.append(segment)
+    return ''.join(parts)
+
+
+# Raw validation error as (path, code, a, b), formatted only when its message is needed.
+# A plain tuple, since building a NamedTuple costs several times more per error.
+_Err = Tuple[_Path, int, Any, Any]
+
+
+def _format_error(error: _Err) -> str:
+    """Format a raw validation error into its message."""
+    path, code, a, b = error
+    return _MESSAGES[code].format(path=_format_path(path), a=a, b=b)
+
+
+# Compiled check: (value, path, result) -> None
+_Check = Callable[[Any, _Path, 'TonValidationResult'], None]
+
+
+class _StopValidation(Exception):
+    """Raised internally once max_errors has been reached."""
+
 
-@dataclass
 class TonValidationResult:
     """Result of validation."""
-    is_valid: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+
+    __slots__ = ('is_valid', '_errors', '_pending', 'warnings')
+
+    def __init__(self, is_valid: bool, errors: Optional[List[str]] = None,
+                 warnings: Optional[List[str]] = None):
+        self.is_valid = is_valid
+        self._errors: List[str] = errors if errors is not None else []
+        self._pending: List[_Err] = []
+        self.warnings: List[str] = warnings if warnings is not None else []
+
+    @property
+    def errors(self) -> List[str]:
+        """Get the error messages, formatting any pending errors first."""
+        if self._pending:
+            self._errors.extend(map(_format_error, self._pending))
+            self._pending.clear()
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: List[str]) -> None:
+        """Replace the error messages."""
+        self._errors = value
+        self._pending.clear()
+
+    @property
+    def error_count(self) -> int:
+        """Get the number of errors without formatting them."""
+        return len(self._errors) + len(self._pending)
+
+    def __repr__(self) -> str:
+        return (f"TonValidationResult(is_valid={self.is_valid!r}, "
+                f"errors={self.errors!r}, warnings={self.warnings!r})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TonValidationResult):
+            return NotImplemented
+        return (self.is_valid, self.errors, self.warnings) == \
+               (other.is_valid, other.errors, other.warnings)
 
 
 class TonValidator:
     """Validator for TON format."""
 
+    def __init__(self, max_errors: Optional[int] = None):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be None or at least 1")
+        # Stop validating once this many errors have been collected (None = no limit)
+        self.max_errors = max_errors
+
     def validate(self, document: TonDocument, schema: Dict[str, Any]) -> TonValidationResult:
-        """Validate a document against a schema."""
-        result = TonValidationResult(is_valid=True)
+        """Validate a document against a schema.
 
-        try:
-            self._validate_value(document.get_root(), schema, '', result)
-        except TonValidationError as e:
-            result.is_valid = False
-            result.errors.append(str(e))
+        The schema is compiled on every call, so changes to it always take effect.
+        Use compile() to validate many documents against a schema that stays the same.
+        """
+        return self.compile(schema)(document)
 
-        return result
+    def compile(self, schema: Dict[str, Any]) -> Callable[[TonDocument], TonValidationResult]:
+        """Compile a schema into a reusable validation function.
 
-    def _validate_value(self, value: Any, schema: Dict[str, Any], path: str,
-                        result: TonValidationResult) -> None:
-        """Validate a value against a schema."""
-        schema_type = schema.get('type')
+        The schema is walked once; the returned function validates documents
+        without looking anything up in the schema dictionaries again.
+        """
+        check = self._compile_value(schema, {})
+
+        def validate_document(document: TonDocument) -> TonValidationResult:
+            result = TonValidationResult(is_valid=True)
 
-        if schema_type == 'object':
-            self._validate_object(value, schema, path, result)
-        elif schema_type == 'array':
-            self._validate_array(value, schema, path, result)
+            try:
+                check(document.get_root(), (), result)
+            except _StopValidation:
+                pass
+            except TonValidationError as e:
+                result.is_valid = False
+                result.errors.append(str(e))
+
+            return result
+
+        return validate_document
+
+    def _error(self, result: TonValidationResult, path: _Path, code: int,
+               a: Any = None, b: Any = None) -> None:
+        """Record an error, stopping validation once max_errors is reached."""
+        result.is_valid = False
+        result._pending.append((path, code, a, b))
+        if self.max_errors is not None and result.error_count >= self.max_errors:
+            raise _StopValidation()
+
+    def _compile_value(self, schema: Dict[str, Any], compiled: Dict[int, _Check]) -> _Check:
+        """Compile the check for a value.
+
+        compiled holds the checks by id(schema) for the schemas compiled so far, so
+        a schema that contains itself is compiled once instead of forever.
+        """
+        known = compiled.get(id(schema))
+        if known is not None:
+            return known
+
+        schema_type = schema.get('type')
+        if schema_type == 'object' or schema_type == 'array':
+            # Nested references to this schema go through a cell that is filled in
+            # once its check has been compiled
+            cell: List[_Check] = []
+
+            def forward(value: Any, path: _Path, result: TonValidationResult) -> None:
+                cell[0](value, path, result)
+
+            compiled[id(schema)] = forward
+            if schema_type == 'object':
+                check = self._compile_object(schema, compiled)
+            else:
+                check = self._compile_array(schema, compiled)
+            cell.append(check)
+            compiled[id(schema)] = check
+            return check
         elif schema_type == 'string':
-            self._validate_string(value, schema, path, result)
+            return self._compile_string(schema)
         elif schema_type == 'number':
-            self._validate_number(value, schema, path, result)
+            return self._compile_number(schema)
         elif schema_type == 'boolean':
-            self._validate_boolean(value, schema, path, result)
+            return self._compile_boolean(schema)
         elif schema_type == 'null':
-            self._validate_null(value, schema, path, result)
-
-    def _validate_object(self, value: Any, schema: Dict[str, Any], path: str,
-                         result: TonValidationResult) -> None:
-        """Validate an object."""
-        if not isinstance(value, TonObject):
-            result.is_valid = False
-            result.errors.append(f"{path}: Expected object, got {type(value).__name__}")
-            return
-
-        # Check required properties
-        required = schema.get('required', [])
-        for req_prop in required:
-            if not value.has(req_prop):
-                result.is_valid = False
-                result.errors.append(f"{path}: Missing required property '{req_prop}'")
-
-        # Validate properties
-        properties_schema = schema.get('properties', {})
-        for key in value.keys():
-            if key in properties_schema:
-                prop_path = f"{path}.{key}" if path else key
-                prop_value = value.get(key)
-                self._validate_value(prop_value, properties_schema[key], prop_path, result)
-
-    def _validate_array(self, value: Any, schema: Dict[str, Any], path: str,
-                        result: TonValidationResult) -> None:
-        """Validate an array."""
-        if not isinstance(value, TonArray):
-            result.is_valid = False
-            result.errors.append(f"{path}: Expected array, got {type(value).__name__}")
-            return
-
-        # Check min/max items
+            return self._compile_null(schema)
+        return _accept
+
+    def _compile_object(self, schema: Dict[str, Any], compiled: Dict[int, _Check]) -> _Check:
+        """Compile the check for an object."""
+        error = self._error
+        # TonObject interns its keys, so interned schema names make each lookup an identity hit
+        required = tuple(map(_intern_key, schema.get('required', [])))
+        required_set = frozenset(required)
+        properties = {_intern_key(key): self._compile_value(prop_schema, compiled)
+                      for key, prop_schema in schema.get('properties', {}).items()}
+
+        def check(value: Any, path: _Path, result: TonValidationResult) -> None:
+            if not isinstance(value, TonObject):
+                error(result, path, _E_TYPE, 'object', type(value))
+                return
+
+            # Check required properties, looking for the missing ones only if any are
+            if not required_set.issubset(value.properties):
+                for req_prop in required:
+                    if not value.has(req_prop):
+                        error(result, path, _E_REQUIRED, req_prop)
+
+            # Validate properties
+            for key, prop_value in value.properties.items():
+                prop_check = properties.get(key)
+                if prop_check is not None:
+                    prop_check(prop_value, (*path, key), result)
+
+        return check
+
+    def _compile_array(self, schema: Dict[str, Any], compiled: Dict[int, _Check]) -> _Check:
+        """Compile the check for an array."""
+        error = self._error
         min_items = schema.get('minItems')
         max_items = schema.get('maxItems')
-        length = value.length()
+        items_schema = schema.get('items')
+        item_check = self._compile_value(items_schema, compiled) if items_schema else None
 
-        if min_items is not None and length < min_items:
-            result.is_valid = False
-            result.errors.append(f"{path}: Array has {length} items, minimum is {min_items}")
+        # Items of a simple type can be checked in bulk before falling back to per-item checks
+        bulk_check = _compile_bulk_check(items_schema) if items_schema else None
 
-        if max_items is not None and length > max_items:
-            result.is_valid = False
-            result.errors.append(f"{path}: Array has {length} items, maximum is {max_items}")
+        def check(value: Any, path: _Path, result: TonValidationResult) -> None:
+            if not isinstance(value, TonArray):
+                error(result, path, _E_TYPE, 'array', type(value))
+                return
 
-        # Validate items
-        items_schema = schema.get('items')
-        if items_schema:
-            for i in range(length):
-                item_path = f"{path}[{i}]"
-                item_value = value.get(i)
-                self._validate_value(item_value, items_schema, item_path, result)
-
-    def _validate_string(self, value: Any, schema: Dict[str, Any], path: str,
-                         result: TonValidationResult) -> None:
-        """Validate a string."""
-        actual_value = value.get_value() if isinstance(value, TonValue) else value
-
-        if not isinstance(actual_value, str):
-            result.is_valid = False
-            result.errors.append(f"{path}: Expected string, got {type(actual_value).__name__}")
-            return
-
-        # Check enum constraint
-        enum_values = schema.get('enum')
-        if enum_values is not None and actual_value not in enum_values:
-            result.is_valid = False
-            result.errors.append(f'{path}: Value "{actual_value}" is not in enum {enum_values}')
-            return
+            # Check min/max items
+            length = value.length()
+
+            if min_items is not None and length < min_items:
+                error(result, path, _E_MIN_ITEMS, length, min_items)
+
+            if max_items is not None and length > max_items:
+                error(result, path, _E_MAX_ITEMS, length, max_items)
+
+            # Validate items
+            if item_check is None:
+                return
+            if bulk_check is not None and length >= _BULK_CHECK_MIN_ITEMS and bulk_check(value):
+                return
+            for i, item_value in enumerate(value.items):
+                item_check(item_value, (*path, i), result)
 
-        # Check min/max length
+        return check
+
+    def _compile_string(self, schema: Dict[str, Any]) -> _Check:
+        """Compile the check for a string."""
+        error = self._error
+        enum_values = schema.get('enum')
+        allowed = _enum_set(enum_values)
         min_length = schema.get('minLength')
         max_length = schema.get('maxLength')
 
-        if min_length is not None and len(actual_value) < min_length:
-            result.is_valid = False
-            result.errors.append(f"{path}: String length {len(actual_value)} is less than minimum {min_length}")
+        def check(value: Any, path: _Path, result: TonValidationResult) -> None:
+            actual_value = value.get_value() if isinstance(value, TonValue) else value
+
+            if not isinstance(actual_value, str):
+                error(result, path, _E_TYPE, 'string', type(actual_value))
+                return
+
+            # Check enum constraint
+            if allowed is not None and actual_value not in allowed:
+                error(result, path, _E_ENUM, actual_value, enum_values)
+                return
 
-        if max_length is not None and len(actual_value) > max_length:
-            result.is_valid = False
-            result.errors.append(f"{path}: String length {len(actual_value)} exceeds maximum {max_length}")
+            # Check min/max length
+            if min_length is not None and len(actual_value) < min_length:
+                error(result, path, _E_MIN_LENGTH, len(actual_value), min_length)
 
-    def _validate_number(self, value: Any, schema: Dict[str, Any], path: str,
-                         result: TonValidationResult) -> None:
-        """Validate a number."""
-        actual_value = value.get_value() if isinstance(value, TonValue) else value
+            if max_length is not None and len(actual_value) > max_length:
+                error(result, path, _E_MAX_LENGTH, len(actual_value), max_length)
 
-        if not isinstance(actual_value, (int, float)):
-            result.is_valid = False
-            result.errors.append(f"{path}: Expected number, got {type(actual_value).__name__}")
-            return
+        return check
 
-        # Check min/max
+    def _compile_number(self, schema: Dict[str, Any]) -> _Check:
+        """Compile the check for a number."""
+        error = self._error
         minimum = schema.get('minimum')
         maximum = schema.get('maximum')
 
-        if minimum is not None and actual_value < minimum:
-            result.is_valid = False
-            result.errors.append(f"{path}: Value {actual_value} is less than minimum {minimum}")
+        def check(value: Any, path: _Path, result: TonValidationResult) -> None:
+            actual_value = value.get_value() if isinstance(value, TonValue) else value
+
+            if not isinstance(actual_value, (int, float)):
+                error(result, path, _E_TYPE, 'number', type(actual_value))
+                return
+
+            # Check min/max
+            if minimum is not None and actual_value < minimum:
+                error(result, path, _E_MINIMUM, actual_value, minimum)
+
+            if maximum is not None and actual_value > maximum:
+                error(result, path, _E_MAXIMUM, actual_value, maximum)
+
+        return check
+
+    def _compile_boolean(self, schema: Dict[str, Any]) -> _Check:
+        """Compile the check for a boolean."""
+        error = self._error
+
+        def check(value: Any, path: _Path, result: TonValidationResult) -> None:
+            actual_value = value.get_value() if isinstance(value, TonValue) else value
+
+            if not isinstance(actual_value, bool):
+                error(result, path, _E_TYPE, 'boolean', type(actual_value))
+
+        return check
+
+    def _compile_null(self, schema: Dict[str, Any]) -> _Check:
+        """Compile the check for null."""
+        error = self._error
+
+        def check(value: Any, path: _Path, result: TonValidationResult) -> None:
+            actual_value = value.get_value() if isinstance(value, TonValue) else value
+
+            if actual_value is not None:
+                error(result, path, _E_TYPE, 'null', type(actual_value))
+
+        return check
+
+
+def _accept(value: Any, path: _Path, result: TonValidationResult) -> None:
+    """Check for schemas without a known type; accepts any value."""
+
+
+def _intern_key(key: Any) -> Any:
+    """Intern a schema property name; TonObject interns its own keys the same way."""
+    return sys.intern(key) if type(key) is str else key
+
+
+def _enum_set(enum_values: Optional[List[Any]]) -> Any:
+    """Get enum values as a frozenset for O(1) membership, or as-is if unhashable."""
+    if enum_values is None:
+        return None
+    try:
+        return frozenset(enum_values)
+    except TypeError:
+        return enum_values
+
+
+def _compile_bulk_check(schema: Dict[str, Any]) -> Optional[Callable[[TonArray], bool]]:
+    """Compile a whole-array check for items of a simple type, if there is one.
+
+    A bulk check returns True only if every item passes. Any other outcome falls
+    back to per-item validation, so error reporting is unchanged.
+    """
+    schema_type = schema.get('type')
+
+    if schema_type == 'number':
+        minimum = schema.get('minimum')
+        maximum = schema.get('maximum')
+
+        def check_numbers(value: TonArray) -> bool:
+            return _numbers_within_bounds(_item_values(value), minimum, maximum)
+
+        return check_numbers
+
+    if schema_type == 'string':
+        allowed = _enum_set(schema.get('enum'))
+        if allowed is not None and not isinstance(allowed, frozenset):
+            return None
+        min_length = schema.get('minLength')
+        max_length = schema.get('maxLength')
+
+        def check_strings(value: TonArray) -> bool:
+            return _strings_within_bounds(_item_values(value), allowed, min_length, max_length)
+
+        return check_strings
+
+    return None
+
+
+def _item_values(value: TonArray) -> List[Any]:
+    """Get the plain values of an array's items."""
+    return [item.get_value() if isinstance(item, TonValue) else item for item in value.items]
+
+
+def _strings_within_bounds(strings: List[Any], allowed: Optional[frozenset],
+                           min_length: Any, max_length: Any) -> bool:
+    """Check that all values are strings within the enum and length limits."""
+    if not strings or not _STRING_TYPES.issuperset(map(type, strings)):
+        return False
+
+    if allowed is not None and not allowed.issuperset(strings):
+        return False
+
+    if min_length is not None or max_length is not None:
+        lengths = list(map(len, strings))
+        if min_length is not None and min(lengths) < min_length:
+            return False
+        if max_length is not None and max(lengths) > max_length:
+            return False
+
+    return True
 
-        if maximum is not None and actual_value > maximum:
-            result.is_valid = False
-            result.errors.append(f"{path}: Value {actual_value} exceeds maximum {maximum}")
 
-    def _validate_boolean(self, value: Any, schema: Dict[str, Any], path: str,
-                          result: TonValidationResult) -> None:
-        """Validate a boolean."""
-        actual_value = value.get_value() if isinstance(value, TonValue) else value
+def _numbers_within_bounds(numbers: List[Any], minimum: Any, maximum: Any) -> bool:
+    """Check that all values are numbers within the minimum and maximum."""
+    if not numbers or not _NUMBER_TYPES.issuperset(map(type, numbers)):
+        return False
 
-        if not isinstance(actual_value, bool):
-            result.is_valid = False
-            result.errors.append(f"{path}: Expected boolean, got {type(actual_value).__name__}")
+    # min()/max() only yield NaN when the first item is NaN; let the item loop handle it
+    if minimum is not None:
+        lowest = min(numbers)
+        if lowest != lowest or lowest < minimum:
+            return False
 
-    def _validate_null(self, value: Any, schema: Dict[str, Any], path: str,
-                       result: TonValidationResult) -> None:
-        """Validate null."""
-        actual_value = value.get_value() if isinstance(value, TonValue) else value
+    if maximum is not None:
+        highest = max(numbers)
+        if highest != highest or highest > maximum:
+            return False
 
-        if actual_value is not None:
-            result.is_valid = False
-            result.errors.append(f"{path}: Expected null, got {type(actual_value).__name__}")
+    return True
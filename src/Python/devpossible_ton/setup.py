@@ -3,11 +3,31 @@ DevPossible.Ton - Python Package Setup
 Copyright (c) 2024 DevPossible, LLC. All rights reserved.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the serializer with Cython when it is installed. The module is
+# compiled as-is, and the extension is optional: if compilation fails, the
+# pure-Python module is used instead.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "devpossible_ton.serializer.ton_serializer",
+                ["devpossible_ton/serializer/ton_serializer.py"],
+                optional=True,
+            ),
+        ],
+        compiler_directives={"language_level": "3"},
+        build_dir="build",
+    )
+
 setup(
     name="devpossible-ton",
     version="0.1.8",
@@ -24,6 +44,7 @@ setup(
         "Specification": "https://tonspec.com",
     },
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
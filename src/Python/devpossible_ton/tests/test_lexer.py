@@ -4,12 +4,6 @@ Copyright (c) 2024 DevPossible, LLC
 """
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from devpossible_ton.lexer import TonLexer, TokenType
 from devpossible_ton.errors import TonParseError
 
@@ -5,7 +5,7 @@ Copyright (c) 2024 DevPossible, LLC
 
 import pytest
 from datetime import datetime
-from devpossible_ton.parser import TonParser
+from devpossible_ton.parser import TonParser, TonParseOptions
 from devpossible_ton.models import TonDocument, TonObject, TonValue, TonArray
 from devpossible_ton.errors import TonParseError
 
@@ -81,6 +81,13 @@ class TestTonParserArrays:
 
         assert result.get_root() == [{'id': 1}, {'id': 2}]
 
+    def test_iterate_parsed_array(self):
+        parser = TonParser()
+        root = parser.parse('[1, "two", null]').get_root()
+
+        assert list(root) == [root[i] for i in range(len(root))] == [1, 'two', None]
+        assert 'two' in root
+
 
 class TestTonParserDataTypes:
     """Tests for different data types."""
@@ -402,4 +409,61 @@ class TestTonParserNumericProperties:
         parser = TonParser()
         result = parser.parse('{ "123": "numeric key" }')
 
-        assert result.get_root()['123'] == 'numeric key'
\ No newline at end of file
+        assert result.get_root()['123'] == 'numeric key'
+
+
+class TestTonParserCache:
+    """Tests for reuse of parsed documents."""
+
+    def test_repeated_parse_returns_independent_documents(self):
+        parser = TonParser()
+        first = parser.parse('{ name: "John", tags: ["a", "b"] }')
+        first.get_root().set('name', TonValue('Jane'))
+        first.get_root().get('tags').push(TonValue('c'))
+
+        second = TonParser().parse('{ name: "John", tags: ["a", "b"] }')
+
+        assert second.get_root()['name'] == 'John'
+        assert second.get_root()['tags'] == ['a', 'b']
+        assert second.get_root() is not first.get_root()
+
+    def test_cached_parse_respects_options(self):
+        text = '[1 2 3]'
+        with pytest.raises(TonParseError):
+            TonParser().parse(text)
+
+        result = TonParser(allow_trailing_comma=True).parse(text)
+        assert result.get_root().length() == 3
+
+        with pytest.raises(TonParseError):
+            TonParser().parse(text)
+
+    def test_parse_without_cache(self):
+        from devpossible_ton.parser import ton_parser
+
+        text = '{ uncached: true }'
+        options = TonParseOptions(use_cache=False)
+        result = TonParser(options).parse(text)
+
+        assert result.get_root()['uncached'] is True
+        assert (text, False) not in ton_parser._parse_cache
+
+    def test_clear_cache(self):
+        from devpossible_ton.parser import ton_parser
+
+        TonParser().parse('{ cached: 1 }')
+        assert ton_parser._parse_cache
+
+        TonParser.clear_cache()
+
+        assert not ton_parser._parse_cache
+
+
+class TestTonParserBytes:
+    """Tests for parsing encoded input."""
+
+    def test_parse_bytes_normalizes_line_endings(self):
+        parser = TonParser()
+        result = parser.parse_bytes('{ text: """\r\n  héllo\r\n  world\r\n""" }'.encode('utf-8'))
+
+        assert result.get_root()['text'] == 'héllo\nworld'
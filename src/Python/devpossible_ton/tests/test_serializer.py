@@ -3,10 +3,39 @@ TonSerializer Tests
 Copyright (c) 2024 DevPossible, LLC
 """
 
+import ast
+import os
+
 import pytest
 from devpossible_ton.serializer import TonSerializer, TonSerializeOptions
 from devpossible_ton.models import TonDocument, TonObject, TonValue, TonArray
-from devpossible_ton.parser import TonParser
+from devpossible_ton.parser import TonParser, TonParseOptions
+from devpossible_ton.errors import TonParseError
+
+
+def _test_corpus_texts():
+    """Collect the TON texts used by the parser, lexer and integration tests.
+
+    These are the string literals passed to parse() or TonLexer(), plus those
+    assigned to a variable first (e.g. content = '''...''').
+    """
+    texts = {}
+    tests_dir = os.path.dirname(__file__)
+    for name in ('test_parser.py', 'test_lexer.py', 'test_integration.py'):
+        with open(os.path.join(tests_dir, name), encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and node.args:
+                func = node.func
+                callee = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+                value = node.args[0] if callee in ('parse', 'TonLexer') else None
+            elif isinstance(node, ast.Assign):
+                value = node.value
+            else:
+                continue
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                texts[value.value] = None
+    return list(texts)
 
 
 class TestTonSerializerBasic:
@@ -50,6 +79,31 @@ class TestTonSerializerBasic:
 
         assert result == '[1,2,3]'
 
+    def test_serialize_plain_number_list(self):
+        doc = TonDocument()
+        doc.set_root({'numbers': [1, 2.5, -3, True]})
+
+        options = TonSerializeOptions(format='compact')
+        serializer = TonSerializer(options)
+        result = serializer.serialize(doc)
+
+        assert result == '{numbers:[1,2.5,-3,true]}'
+
+        doc.set_root({'numbers': list(range(5))})
+        assert serializer.serialize(doc) == '{numbers:[0,1,2,3,4]}'
+
+    def test_serialize_typed_array(self):
+        from array import array
+
+        doc = TonDocument()
+        doc.set_root({'ints': array('i', range(3)), 'floats': array('d', [0.5, 1.5])})
+
+        options = TonSerializeOptions(format='compact')
+        serializer = TonSerializer(options)
+        result = serializer.serialize(doc)
+
+        assert result == '{ints:[0,1,2],floats:[0.5,1.5]}'
+
     def test_serialize_nested_objects(self):
         inner = TonObject()
         inner.set('city', TonValue('New York'))
@@ -136,6 +190,20 @@ class TestTonSerializerDataTypes:
 
         assert result == '{text:"Hello \\"World\\""}'
 
+    def test_serialize_strings_with_escapes_round_trip(self):
+        text = 'Line 1\nLine 2\tTabbed "quoted" C:\\path'
+        obj = TonObject()
+        obj.set('text', TonValue(text))
+
+        doc = TonDocument()
+        doc.set_root(obj)
+
+        options = TonSerializeOptions(format='compact')
+        result = TonSerializer(options).serialize(doc)
+
+        assert result == '{text:"Line 1\\nLine 2\\tTabbed \\"quoted\\" C:\\\\path"}'
+        assert TonParser().parse(result).get_root().get('text').get_value() == text
+
     def test_serialize_numbers(self):
         obj = TonObject()
         obj.set('int', TonValue(42))
@@ -194,6 +262,19 @@ class TestTonSerializerDataTypes:
 
         assert result == '{id:550e8400-e29b-41d4-a716-446655440000}'
 
+    def test_serialize_guid_shaped_string_is_quoted(self):
+        obj = TonObject()
+        obj.set('id', TonValue('zzzzzzzz-e29b-41d4-a716-446655440000'))
+
+        doc = TonDocument()
+        doc.set_root(obj)
+
+        options = TonSerializeOptions(format='compact')
+        serializer = TonSerializer(options)
+        result = serializer.serialize(doc)
+
+        assert result == '{id:"zzzzzzzz-e29b-41d4-a716-446655440000"}'
+
 
 class TestTonSerializerTypeAnnotations:
     """Tests for type annotations."""
@@ -382,4 +463,100 @@ class TestTonSerializerRoundTrip:
         parser = TonParser()
         parsed = parser.parse(serialized)
 
-        assert parsed.get_root() == original
\ No newline at end of file
+        assert parsed.get_root() == original
+
+    def test_reformat_matches_parse_and_serialize(self):
+        text = ('Person(3){ name: "John", age: %30, tags: [|admin|, |a|b|], '
+                'extra: null, empty: [], nested: {}, id: 550e8400-e29b-41d4-a716-446655440000, '
+                'name: "Jane", _meta: 1 }')
+
+        option_sets = [
+            TonSerializeOptions.compact(),
+            TonSerializeOptions.pretty(),
+            TonSerializeOptions(omit_nulls=True, omit_empty_collections=True,
+                                sort_properties=True, include_hints=True),
+        ]
+        for options in option_sets:
+            expected = TonSerializer(options).serialize(TonParser().parse(text))
+            assert TonSerializer(options).reformat(text) == expected
+
+    def test_reformat_matches_parse_and_serialize_on_test_corpus(self):
+        # Every TON text the parser, lexer and integration tests feed in, so a
+        # grammar change that reformat does not follow shows up here
+        texts = _test_corpus_texts()
+        assert len(texts) > 50
+
+        option_sets = [
+            TonSerializeOptions(),
+            TonSerializeOptions(format='compact'),
+            TonSerializeOptions.compact(),
+            TonSerializeOptions(omit_nulls=True, omit_empty_collections=True,
+                                sort_properties=True, include_hints=True),
+        ]
+        for text in texts:
+            for allow_trailing_comma in (False, True):
+                parse_options = TonParseOptions(allow_trailing_comma=allow_trailing_comma,
+                                                use_cache=False)
+                for options in option_sets:
+                    serializer = TonSerializer(options)
+                    try:
+                        expected = serializer.serialize(TonParser(parse_options).parse(text))
+                    except Exception as error:
+                        expected = (type(error), str(error))
+                    try:
+                        actual = serializer.reformat(text, parse_options)
+                    except Exception as error:
+                        actual = (type(error), str(error))
+                    assert actual == expected, text
+
+    def test_reformat_reports_parse_errors(self):
+        with pytest.raises(TonParseError) as parse_error:
+            TonParser().parse('{name: "John"')
+        with pytest.raises(TonParseError) as reformat_error:
+            TonSerializer().reformat('{name: "John"')
+
+        assert str(reformat_error.value) == str(parse_error.value)
+
+    def test_module_serialize_reuses_serializer_across_options(self):
+        import devpossible_ton
+
+        obj = TonObject()
+        obj.set('name', TonValue('John'))
+        doc = TonDocument(obj)
+
+        compact = devpossible_ton.serialize(doc, TonSerializeOptions(format='compact'))
+        pretty = devpossible_ton.serialize(doc, TonSerializeOptions(format='pretty'))
+
+        assert compact == '{name:"John"}'
+        assert pretty == TonSerializer(TonSerializeOptions(format='pretty')).serialize(doc)
+        assert devpossible_ton.serialize(doc) == TonSerializer().serialize(doc)
+
+    def test_module_serialize_nested_call_keeps_outer_options(self):
+        import devpossible_ton
+
+        class Stamp:
+            def isoformat(self):
+                # Serializes with other options while the outer call is in progress
+                return devpossible_ton.serialize(TonDocument({'x': 1}),
+                                                 TonSerializeOptions(format='compact'))
+
+        inner = TonObject()
+        inner.set('k', TonValue('v'))
+        obj = TonObject()
+        obj.set('a', TonValue(Stamp()))
+        obj.set('b', inner)
+        doc = TonDocument(obj)
+
+        options = TonSerializeOptions(format='pretty')
+        result = devpossible_ton.serialize(doc, options)
+
+        assert result == TonSerializer(options).serialize(doc)
+
+    def test_key_prefix_cache_is_bounded(self):
+        from devpossible_ton.serializer.ton_serializer import _KEY_PREFIX_CACHE_SIZE
+
+        serializer = TonSerializer()
+        for i in range(_KEY_PREFIX_CACHE_SIZE + 10):
+            serializer.serialize(TonDocument({f'key{i}': i}))
+
+        assert len(serializer._key_prefixes) <= _KEY_PREFIX_CACHE_SIZE + 1
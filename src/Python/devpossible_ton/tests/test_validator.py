@@ -433,6 +433,70 @@ class TestTonValidatorArrayValidation:
 
         assert result.is_valid is True
 
+    def test_validate_large_number_array_bounds(self):
+        arr = TonArray()
+        for i in range(1000):
+            arr.push(TonValue(i))
+
+        obj = TonObject()
+        obj.set('numbers', arr)
+
+        doc = TonDocument()
+        doc.set_root(obj)
+
+        schema = {
+            'type': 'object',
+            'properties': {
+                'numbers': {
+                    'type': 'array',
+                    'items': {'type': 'number', 'minimum': 0, 'maximum': 999}
+                }
+            }
+        }
+
+        validator = TonValidator()
+        assert validator.validate(doc, schema).is_valid is True
+
+        arr.push(TonValue(1000))
+        arr.push(TonValue('oops'))
+        result = validator.validate(doc, schema)
+
+        assert result.is_valid is False
+        assert len(result.errors) == 2
+        assert 'numbers[1000]: Value 1000 exceeds maximum 999' in result.errors[0]
+        assert 'numbers[1001]: Expected number, got str' in result.errors[1]
+
+    def test_validate_large_string_array_enum(self):
+        arr = TonArray()
+        for i in range(1000):
+            arr.push(TonValue('red' if i % 2 else 'blue'))
+
+        obj = TonObject()
+        obj.set('colors', arr)
+
+        doc = TonDocument()
+        doc.set_root(obj)
+
+        schema = {
+            'type': 'object',
+            'properties': {
+                'colors': {
+                    'type': 'array',
+                    'items': {'type': 'string', 'enum': ['red', 'blue'], 'maxLength': 4}
+                }
+            }
+        }
+
+        validator = TonValidator()
+        assert validator.validate(doc, schema).is_valid is True
+
+        arr.push(TonValue('green'))
+        result = validator.validate(doc, schema)
+
+        assert result.is_valid is False
+        assert len(result.errors) == 1
+        assert 'colors[1000]: Value "green" is not in enum' in result.errors[0]
+
 
 class TestTonValidatorNestedObjects:
     """Tests for nested object validation."""
@@ -503,6 +567,27 @@ class TestTonValidatorNestedObjects:
 
         assert result.is_valid is True
 
+    def test_validate_recursive_schema(self):
+        child = TonObject()
+        child.set('name', TonValue(1))
+
+        root = TonObject()
+        root.set('name', TonValue('a'))
+        root.set('child', child)
+
+        doc = TonDocument()
+        doc.set_root(root)
+
+        # A tree node whose children are described by the same schema
+        schema = {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+        schema['properties']['child'] = schema
+
+        validator = TonValidator()
+        result = validator.validate(doc, schema)
+
+        assert result.is_valid is False
+        assert result.errors == ['child.name: Expected string, got int']
+
 
 class TestTonValidatorEnumValidation:
     """Tests for enum validation."""
@@ -585,6 +670,87 @@ class TestTonValidatorComplexSchemas:
 
         assert result.is_valid is True
 
+    def test_stop_after_max_errors(self):
+        arr = TonArray()
+        for i in range(100):
+            arr.push(TonValue(f'item{i}'))
+
+        doc = TonDocument()
+        doc.set_root(arr)
+
+        schema = {
+            'type': 'array',
+            'items': {'type': 'number'}
+        }
+
+        result = TonValidator(max_errors=3).validate(doc, schema)
+
+        assert result.is_valid is False
+        assert result.error_count == 3
+        assert result.errors == [
+            '[0]: Expected number, got str',
+            '[1]: Expected number, got str',
+            '[2]: Expected number, got str',
+        ]
+
+        assert len(TonValidator().validate(doc, schema).errors) == 100
+
+    def test_max_errors_boundary(self):
+        arr = TonArray()
+        arr.push(TonValue('a'))
+        arr.push(TonValue('b'))
+        doc = TonDocument(arr)
+        schema = {'type': 'array', 'items': {'type': 'number'}}
+
+        result = TonValidator(max_errors=1).validate(doc, schema)
+        assert result.errors == ['[0]: Expected number, got str']
+
+        for max_errors in (0, -1):
+            with pytest.raises(ValueError):
+                TonValidator(max_errors=max_errors)
+
+    def test_compiled_schema_validates_many_documents(self):
+        schema = {
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string', 'minLength': 2},
+                'age': {'type': 'number', 'minimum': 0}
+            }
+        }
+
+        validator = TonValidator()
+        check = validator.compile(schema)
+
+        results = []
+        for name, age in [('Alice', 30), ('B', 25), ('Carol', -1)]:
+            obj = TonObject()
+            obj.set('name', TonValue(name))
+            obj.set('age', TonValue(age))
+            results.append(check(TonDocument(obj)))
+
+        assert [r.is_valid for r in results] == [True, False, False]
+        assert results[1].errors == ['name: String length 1 is less than minimum 2']
+        assert results[2].errors == ['age: Value -1 is less than minimum 0']
+        assert results[2] == validator.validate(TonDocument(obj), schema)
+
+    def test_validate_sees_schema_changes(self):
+        schema = {'type': 'object', 'properties': {'age': {'type': 'number', 'minimum': 0}}}
+
+        obj = TonObject()
+        obj.set('age', TonValue(5))
+        doc = TonDocument(obj)
+
+        validator = TonValidator()
+        assert validator.validate(doc, schema).is_valid is True
+
+        schema['properties']['age']['minimum'] = 10
+        schema['required'] = ['name']
+        result = validator.validate(doc, schema)
+
+        assert result.is_valid is False
+        assert len(result.errors) == 2
+
 
 class TestTonValidatorPathBasedValidation:
     """Tests for path-based validation rules."""
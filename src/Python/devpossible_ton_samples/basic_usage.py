@@ -52,12 +52,23 @@ ton_data = '''
 }
 '''
 
+# Parsed form of ton_data, created on first use so repeated main() calls reuse it
+_parsed_document = None
+
+
+def _get_document():
+    """Get the parsed sample document, parsing ton_data only once."""
+    global _parsed_document
+    if _parsed_document is None:
+        _parsed_document = ton.parse(ton_data)
+    return _parsed_document
+
 
 def main():
     """Main function demonstrating TON library usage."""
     try:
         # Parse TON data
-        document = ton.parse(ton_data)
+        document = _get_document()
 
         print("Parsed TON Document:")
         print(document.to_json())
@@ -0,0 +1,14 @@
+"""
+Import setup shared by the examples
+Copyright (c) 2024 DevPossible, LLC
+"""
+
+import os
+import sys
+
+# Make the library importable when running from a source checkout; importing
+# this module once per process is enough for every example
+_LIBRARY_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+if _LIBRARY_DIR not in sys.path:
+    sys.path.insert(0, _LIBRARY_DIR)
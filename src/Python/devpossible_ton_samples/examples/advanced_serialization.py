@@ -4,9 +4,8 @@ Advanced Serialization Example
 Copyright (c) 2024 DevPossible, LLC
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+# Imported for its side effect of putting the library on sys.path
+from . import _bootstrap  # noqa: F401
 
 import devpossible_ton as ton
 
@@ -43,9 +42,10 @@ def run():
     # Example 2: Pretty format with indentation
     print('\n2. Pretty format with indentation:')
     pretty = serializer.serialize(document)
-    lines = pretty.split('\n')
+    # Only the first lines are shown, so stop splitting after them
+    lines = pretty.split('\n', 15)[:15]
     print('   First few lines:')
-    for line in lines[:15]:
+    for line in lines:
         print(f'   {line}')
 
     # Example 3: Round-trip test
@@ -4,9 +4,8 @@ Complex Document Example
 Copyright (c) 2024 DevPossible, LLC
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+# Imported for its side effect of putting the library on sys.path
+from . import _bootstrap  # noqa: F401
 
 import devpossible_ton as ton
 from datetime import datetime
@@ -94,7 +93,8 @@ def run():
     mixed_data = mixed_doc.to_json()
     
     print(f'   Items array length: {len(mixed_data["items"])}')
-    print(f'   Item types: {", ".join(type(i).__name__ for i in mixed_data["items"])}')
+    # join() builds a list from its argument anyway, so hand it one directly
+    print(f'   Item types: {", ".join([type(i).__name__ for i in mixed_data["items"]])}')
     print(f'   Feature flags count: {len(mixed_data["settings"]["feature_flags"])}')
 
     # Example 4: Large document summary
@@ -4,9 +4,8 @@ Error Handling Example
 Copyright (c) 2024 DevPossible, LLC
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+# Imported for its side effect of putting the library on sys.path
+from . import _bootstrap  # noqa: F401
 
 import devpossible_ton as ton
 
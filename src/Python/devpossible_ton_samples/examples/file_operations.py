@@ -4,13 +4,16 @@ File Operations Example
 Copyright (c) 2024 DevPossible, LLC
 """
 
-import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+# Imported for its side effect of putting the library on sys.path
+from . import _bootstrap  # noqa: F401
 
 import devpossible_ton as ton
 from datetime import datetime
 
+# Directory holding the sample .ton files
+_SAMPLE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'SampleData'))
+
 
 def run():
     """Run file operations examples."""
@@ -18,7 +21,7 @@ def run():
 
     # Example 1: Read TON file
     print('1. Reading TON file:')
-    simple_path = os.path.join(os.path.dirname(__file__), '..', 'SampleData', 'simple.ton')
+    simple_path = os.path.join(_SAMPLE_DIR, 'simple.ton')
     
     try:
         with open(simple_path, 'r', encoding='utf-8') as f:
@@ -34,7 +37,7 @@ def run():
 
     # Example 2: Write TON file
     print('\n2. Writing TON file:')
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'SampleData', 'output.ton')
+    output_path = os.path.join(_SAMPLE_DIR, 'output.ton')
     
     data = {
         'application': 'Sample App',
@@ -62,7 +65,7 @@ def run():
 
     # Example 3: Read and modify
     print('\n3. Read, modify, and save:')
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'SampleData', 'config.ton')
+    config_path = os.path.join(_SAMPLE_DIR, 'config.ton')
     
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -81,7 +84,7 @@ def run():
             root.set('version', '1.0.1')
         
         # Save modified version
-        modified_path = os.path.join(os.path.dirname(__file__), '..', 'SampleData', 'config-modified.ton')
+        modified_path = os.path.join(_SAMPLE_DIR, 'config-modified.ton')
         modified_content = serializer.serialize(config_doc)
         
         with open(modified_path, 'w', encoding='utf-8') as f:
@@ -93,22 +96,25 @@ def run():
 
     # Example 4: Batch processing
     print('\n4. Batch file processing:')
-    sample_dir = os.path.join(os.path.dirname(__file__), '..', 'SampleData')
     
     try:
-        files = [f for f in os.listdir(sample_dir) if f.endswith('.ton')]
+        # scandir entries carry their file type, so no extra stat call per file
+        with os.scandir(_SAMPLE_DIR) as entries:
+            files = sorted((entry for entry in entries
+                            if entry.name.endswith('.ton') and entry.is_file()),
+                           key=lambda entry: entry.name)
         
         print(f'   Found {len(files)} TON files:')
         
         parser = ton.TonParser()
-        for file in files:
+        for entry in files:
             try:
-                file_path = os.path.join(sample_dir, file)
-                with open(file_path, 'r', encoding='utf-8') as f:
+                # Read raw bytes and decode once in the parser
+                with open(entry.path, 'rb') as f:
                     content = f.read()
-                document = parser.parse(content)
-                print(f'     ✓ {file} - Valid TON file')
+                document = parser.parse_bytes(content)
+                print(f'     ✓ {entry.name} - Valid TON file')
             except Exception as error:
-                print(f'     ✗ {file} - Parse error: {error}')
+                print(f'     ✗ {entry.name} - Parse error: {error}')
     except Exception as error:
         print(f'   Error reading directory: {error}')
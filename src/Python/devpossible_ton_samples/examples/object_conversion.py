@@ -4,9 +4,8 @@ Object Conversion Example
 Copyright (c) 2024 DevPossible, LLC
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+# Imported for its side effect of putting the library on sys.path
+from . import _bootstrap  # noqa: F401
 
 import devpossible_ton as ton
 from datetime import datetime
@@ -48,7 +47,7 @@ def run():
     ton_string = serializer.serialize(ton_doc)
     
     print('   TON Output:')
-    for line in ton_string.split('\n'):
+    for line in ton_string.splitlines():
         print(f'   {line}')
 
     # Example 3: Convert TON back to Python object
@@ -99,8 +98,8 @@ def run():
     
     print('   Settings object created')
     
-    settings_ton = serializer.serialize(settings_doc)
-    settings_back = parser.parse(settings_ton).to_json()
+    # An independent copy only needs the model cloned, not written out and re-read
+    settings_back = settings_doc.clone().to_json()
     
     print(f'   Theme: {settings_back["theme"]}')
     print(f'   Font Size: {settings_back["fontSize"]}')
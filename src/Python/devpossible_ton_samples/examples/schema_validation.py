@@ -4,9 +4,8 @@ Schema Validation Example
 Copyright (c) 2024 DevPossible, LLC
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'devpossible_ton'))
+# Imported for its side effect of putting the library on sys.path
+from . import _bootstrap  # noqa: F401
 
 import devpossible_ton as ton
 
@@ -193,10 +192,13 @@ def run():
         }
     }
 
+    # Compile the schema once and reuse the resulting check for every document
+    validate_document = validator.compile(doc_schema)
+
     print('   Validating multiple documents:')
     for index, data in enumerate(documents):
         doc = ton.TonDocument()
         doc.set_root(data)
-        result = validator.validate(doc, doc_schema)
+        result = validate_document(doc)
         status = '✓ Valid' if result.is_valid else '✗ Invalid'
         print(f'     Doc {index + 1}: {status}')
@@ -4,79 +4,128 @@ DevPossible.Ton Python Sample Programs
 Copyright (c) 2024 DevPossible, LLC
 """
 
+import importlib
 import sys
 import os
 
 # Add the library to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'devpossible_ton'))
 
-from examples import (
-    array_operations, 
-    file_operations, 
-    schema_validation,
-    object_conversion,
-    advanced_serialization,
-    error_handling,
-    complex_document,
-    performance_test
-)
-
-
-def display_menu():
-    """Display the main menu."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    print('============================================')
-    print('  DevPossible.Ton Library Sample Programs  ')
-    print('============================================\n')
-    print('Select a sample to run:')
-    print('1. Basic Usage - Parse simple TON content')
-    print('2. File Operations - Read and write TON files')
-    print('3. Object Conversion - Convert objects to/from TON')
-    print('4. Schema Validation - Validate TON with schemas')
-    print('5. Array Operations - Work with arrays in TON')
-    print('6. Advanced Serialization - Serialization options')
-    print('7. Complex Document - Complex nested structures')
-    print('8. Error Handling - Handle errors and edge cases')
-    print('9. Performance Test - Performance benchmarks')
-    print('0. Exit')
-    print()
+# Platform checks, made once rather than on every screen clear
+_IS_WINDOWS = os.name == 'nt'
+_CLEAR_COMMAND = 'cls' if _IS_WINDOWS else 'clear'
+
+# Home the cursor, clear the screen and its scrollback, as 'clear' does
+_CLEAR_SCREEN = '\x1b[H\x1b[2J\x1b[3J'
+
+
+def _enable_ansi():
+    """Check whether the console understands ANSI escapes, turning them on for Windows."""
+    if not sys.stdout.isatty():
+        return False
+    if not _IS_WINDOWS:
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING, available from Windows 10
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+_USE_ANSI = _enable_ansi()
+
+# The menu never changes, so it is built once and written in one call
+_MENU_TEXT = '\n'.join([
+    '============================================',
+    '  DevPossible.Ton Library Sample Programs  ',
+    '============================================',
+    '',
+    'Select a sample to run:',
+    '1. Basic Usage - Parse simple TON content',
+    '2. File Operations - Read and write TON files',
+    '3. Object Conversion - Convert objects to/from TON',
+    '4. Schema Validation - Validate TON with schemas',
+    '5. Array Operations - Work with arrays in TON',
+    '6. Advanced Serialization - Serialization options',
+    '7. Complex Document - Complex nested structures',
+    '8. Error Handling - Handle errors and edge cases',
+    '9. Performance Test - Performance benchmarks',
+    '0. Exit',
+    '',
+]) + '\n'
+
+
+def clear_screen():
+    """Clear the console, without starting a shell where escapes are supported."""
+    if _USE_ANSI:
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
+    else:
+        os.system(_CLEAR_COMMAND)
+
+
+def display_menu(clear=True):
+    """Display the main menu, below the current output if clear is False."""
+    if clear:
+        clear_screen()
+    else:
+        sys.stdout.write('\n')
+    sys.stdout.write(_MENU_TEXT)
+    sys.stdout.flush()
 
 
 def run_basic_usage():
     """Run the basic usage sample."""
+    print('Running Basic Usage sample...\n')
     import basic_usage
     basic_usage.main()
 
 
+# Example module behind each menu choice, imported only when it is chosen
+_SAMPLE_MODULES = {
+    '2': 'file_operations',
+    '3': 'object_conversion',
+    '4': 'schema_validation',
+    '5': 'array_operations',
+    '6': 'advanced_serialization',
+    '7': 'complex_document',
+    '8': 'error_handling',
+    '9': 'performance_test',
+}
+
+# Resolved run functions by choice; examples are added the first time they run
+_sample_runners = {'1': run_basic_usage}
+
+
+def _get_runner(choice):
+    """Get the run function for a menu choice, or None if the choice is invalid."""
+    runner = _sample_runners.get(choice)
+    if runner is None and choice in _SAMPLE_MODULES:
+        runner = importlib.import_module(f'examples.{_SAMPLE_MODULES[choice]}').run
+        _sample_runners[choice] = runner
+    return runner
+
+
 def run_sample(choice):
     """Run the selected sample."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
+    clear_screen()
+
+    if choice == '0':
+        print('Exiting samples. Thank you!')
+        return False
+
     try:
-        if choice == '1':
-            print('Running Basic Usage sample...\n')
-            run_basic_usage()
-        elif choice == '2':
-            file_operations.run()
-        elif choice == '3':
-            object_conversion.run()
-        elif choice == '4':
-            schema_validation.run()
-        elif choice == '5':
-            array_operations.run()
-        elif choice == '6':
-            advanced_serialization.run()
-        elif choice == '7':
-            complex_document.run()
-        elif choice == '8':
-            error_handling.run()
-        elif choice == '9':
-            performance_test.run()
-        elif choice == '0':
-            print('Exiting samples. Thank you!')
-            return False
-        else:
+        runner = _get_runner(choice)
+        if runner is None:
             print('Invalid choice. Please try again.')
+        else:
+            runner()
     except Exception as error:
         print(f'\nError: {error}')
     
@@ -86,15 +135,22 @@ def run_sample(choice):
 def main():
     """Main entry point."""
     continue_running = True
+    clear = True
     
     while continue_running:
-        display_menu()
-        choice = input('Enter your choice: ')
+        display_menu(clear)
+        try:
+            choice = input('Enter your choice: ')
+        except EOFError:
+            # Input was closed, e.g. piped stdin ran out, so nothing more can be chosen
+            print()
+            break
         
         continue_running = run_sample(choice)
         
-        if continue_running:
-            input('\nPress Enter to continue...')
+        # The sample's output stays on screen with the next menu below it,
+        # so choosing again is the only read per sample
+        clear = False
 
 
 if __name__ == '__main__':